@@ -5,40 +5,54 @@
 SERVER="172.191.139.108"
 USER="azureuser"
 
+# Reuse one SSH connection for every step instead of a handshake per command
+SSH_OPTS="-o ControlMaster=auto -o ControlPath=~/.ssh/cm-%r@%h:%p -o ControlPersist=60s"
+# Only start a master if one from an earlier run isn't still alive
+ssh -O check $SSH_OPTS $USER@$SERVER 2>/dev/null || ssh -MNf $SSH_OPTS $USER@$SERVER
+
 echo "🔍 OrbX Server Diagnostics"
 echo "=========================================="
 echo ""
 
+# Fetch the container logs once and run every log query against that copy
+ssh $SSH_OPTS $USER@$SERVER bash <<'EOF'
+L=$(mktemp)
+trap 'rm -f "$L"' EXIT
+docker logs orbx-server > "$L" 2>&1
+
 echo "📊 1. Recent server logs (last 100 lines):"
 echo "─────────────────────────────────────────"
-ssh $USER@$SERVER "docker logs orbx-server --tail 100"
+tail -100 "$L"
 echo ""
 
 echo "❌ 2. Error messages:"
 echo "─────────────────────────────────────────"
-ssh $USER@$SERVER "docker logs orbx-server 2>&1 | grep -i 'error\|fail\|panic' | tail -20"
+grep -iE 'error|fail|panic' "$L" | tail -20
 echo ""
 
 echo "🔥 3. Stack traces (if any):"
 echo "─────────────────────────────────────────"
-ssh $USER@$SERVER "docker logs orbx-server 2>&1 | grep -A 10 'panic\|runtime error' | tail -30"
+grep -A 10 -E 'panic|runtime error' "$L" | tail -30
 echo ""
 
 echo "📡 4. Recent HTTP requests:"
 echo "─────────────────────────────────────────"
-ssh $USER@$SERVER "docker logs orbx-server 2>&1 | grep -i 'http\|request\|response' | tail -20"
+grep -iE 'http|request|response' "$L" | tail -20
 echo ""
+EOF
 
 echo "✅ 5. Server status:"
 echo "─────────────────────────────────────────"
-ssh $USER@$SERVER "docker ps | grep orbx-server"
+ssh $SSH_OPTS $USER@$SERVER "docker ps | grep orbx-server"
 echo ""
 
 echo "🔧 6. Container resource usage:"
 echo "─────────────────────────────────────────"
-ssh $USER@$SERVER "docker stats orbx-server --no-stream"
+ssh $SSH_OPTS $USER@$SERVER "docker stats orbx-server --no-stream"
 echo ""
 
+ssh -O exit $SSH_OPTS $USER@$SERVER 2>/dev/null
+
 echo "=========================================="
 echo "✅ Diagnostics complete"
 echo ""
@@ -109,39 +109,30 @@ echo -e "${BLUE}╚════════════════════
 
 # Microsoft Teams
 test_protocol "Microsoft Teams" "/teams/messages" "Mozilla/5.0 Teams/1.5.00.32283"
-sleep 0.5
 
 # Shaparak Banking
 test_protocol "Shaparak Banking" "/shaparak/transaction" "ShaparakClient/2.0"
-sleep 0.5
 
 # DNS over HTTPS
 test_protocol "DNS over HTTPS" "/dns-query" "Mozilla/5.0"
-sleep 0.5
 
 # Google Workspace
 test_protocol "Google Workspace" "/google/" "Mozilla/5.0 Chrome/120.0.0.0"
-sleep 0.5
 
 # Zoom
 test_protocol "Zoom" "/zoom/" "Mozilla/5.0 Zoom/5.16.0"
-sleep 0.5
 
 # FaceTime
 test_protocol "FaceTime" "/facetime/" "FaceTime/1.0 CFNetwork/1404.0.5"
-sleep 0.5
 
 # VK
 test_protocol "VK" "/vk/" "VKAndroidApp/7.26"
-sleep 0.5
 
 # Yandex
 test_protocol "Yandex" "/yandex/" "Mozilla/5.0 YaBrowser/23.11.0"
-sleep 0.5
 
 # WeChat
 test_protocol "WeChat" "/wechat/" "MicroMessenger/8.0.37"
-sleep 0.5
 
 # HTTPS Generic
 test_protocol "HTTPS Generic" "/" "Mozilla/5.0 Chrome/120.0.0.0"